@@ -163,19 +163,17 @@ class StatisticBase_PSpec2D(object):
         else:
             self.high_cut = self._to_pixel_freq(high_cut)
 
-        x = np.log10(self.freqs[clip_func(self.freqs.value, self.low_cut.value,
-                                          self.high_cut.value)].value)
+        clip_mask = clip_func(self.freqs.value, self.low_cut.value,
+                              self.high_cut.value)
 
-        clipped_ps1D = self.ps1D[clip_func(self.freqs.value,
-                                           self.low_cut.value,
-                                           self.high_cut.value)]
+        x = np.log10(self.freqs[clip_mask].value)
+
+        clipped_ps1D = self.ps1D[clip_mask]
         y = np.log10(clipped_ps1D)
 
         if weighted_fit:
 
-            clipped_stddev = self.ps1D_stddev[clip_func(self.freqs.value,
-                                                        self.low_cut.value,
-                                                        self.high_cut.value)]
+            clipped_stddev = self.ps1D_stddev[clip_mask]
 
             clipped_stddev[clipped_stddev == 0.] = np.NaN
 
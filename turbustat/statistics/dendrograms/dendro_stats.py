@@ -1,7 +1,7 @@
 # Licensed under an MIT open source license - see LICENSE
 from __future__ import print_function, absolute_import, division
 
-'''
+r'''
 
 Dendrogram statistics as described in Burkhart et al. (2013)
 Two statistics are contained:
@@ -33,7 +33,7 @@ from .mecdf import mecdf
 
 class Dendrogram_Stats(BaseStatisticMixIn):
 
-    """
+    r"""
     Dendrogram statistics as described in Burkhart et al. (2013)
     Two statistics are contained:
     * number of leaves & branches vs. :math:`\delta` parameter
@@ -188,7 +188,7 @@ def fit_elliptical_powerlaw(values, x, y, p0, fit_method='LevMarq',
 
 
 class LogEllipticalPowerLaw2D(Fittable2DModel):
-    """
+    r"""
     Two-dimensional elliptical power-law fit in log-log space.
 
     Adapted from http://adsabs.harvard.edu/abs/2015A&A...580A..79T.
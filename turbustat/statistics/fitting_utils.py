@@ -310,7 +310,7 @@ def check_fit_limits(xlow, xhigh):
 
 
 def clip_func(arr, low, high):
-    return np.logical_and(arr > low, arr <= high)
+    return (arr > low) & (arr <= high)
 
 
 def residual_bootstrap(fit_model, nboot=1000, seed=38574895,
@@ -17,7 +17,7 @@ from ..base_pspec2 import StatisticBase_PSpec2D
 from ..base_statistic import BaseStatisticMixIn
 from ...io import input_data, common_types, twod_types
 from ..fitting_utils import check_fit_limits
-from ..rfft_to_fft import rfft_to_fft
+from ..rfft_to_fft import rfft_to_fft, expand_rfft
 
 
 class MVC(BaseStatisticMixIn, StatisticBase_PSpec2D):
@@ -79,19 +79,16 @@ class MVC(BaseStatisticMixIn, StatisticBase_PSpec2D):
         self.shape = self.centroid.shape
 
         # Get rid of nans.
-        isnan = np.logical_and(np.isnan(self.centroid),
-                               np.isnan(self.moment0))
-        isnan = np.logical_and(isnan,
-                               np.isnan(self.linewidth))
+        isnan = np.isnan(self.centroid)
+        isnan &= np.isnan(self.moment0)
+        isnan &= np.isnan(self.linewidth)
 
         if isnan.any():
-            # Need to make copies to avoid making changes to original data
-            self._centroid = self._centroid.copy()
-            self._centroid[isnan] = 0.
-            self._moment0 = self._moment0.copy()
-            self._moment0[isnan] = 0.
-            self._linewidth = self._linewidth.copy()
-            self._linewidth[isnan] = 0.
+            # Avoid making changes to original data. Copy and fill in one
+            # pass.
+            self._centroid = np.where(isnan, 0., self._centroid)
+            self._moment0 = np.where(isnan, 0., self._moment0)
+            self._linewidth = np.where(isnan, 0., self._linewidth)
 
         self.load_beam(beam=beam)
 
@@ -160,23 +157,27 @@ class MVC(BaseStatisticMixIn, StatisticBase_PSpec2D):
                                                 alpha=alpha,
                                                 beta=beta)
             term1_data = self.centroid * self.moment0 * apod_kernel
-            term2_data = self.linewidth**2 + self.centroid**2 * apod_kernel
+            term2_data = self.linewidth * self.linewidth + \
+                self.centroid * self.centroid * apod_kernel
             mom0_data = self.moment0 * apod_kernel
 
         else:
             term1_data = self.centroid * self.moment0
-            term2_data = self.linewidth**2 + self.centroid**2
+            term2_data = self.linewidth * self.linewidth + \
+                self.centroid * self.centroid
             mom0_data = self.moment0
 
         if pyfftw_kwargs.get('threads') is not None:
             pyfftw_kwargs.pop('threads')
 
-        term1 = rfft_to_fft(term1_data,
+        # Combine the terms on the half-spectra and only expand the result
+        # to the full FFT shape.
+        term1 = rfft_to_fft(term1_data, keep_rfft=True,
                             use_pyfftw=use_pyfftw,
                             threads=threads,
                             **pyfftw_kwargs)
 
-        fft_mom0 = rfft_to_fft(mom0_data,
+        fft_mom0 = rfft_to_fft(mom0_data, keep_rfft=True,
                                use_pyfftw=use_pyfftw,
                                threads=threads,
                                **pyfftw_kwargs)
@@ -184,12 +185,16 @@ class MVC(BaseStatisticMixIn, StatisticBase_PSpec2D):
         # Account for normalization in the line width.
         term2 = np.nanmean(term2_data)
 
-        mvc_fft = term1 - term2 * fft_mom0
+        # Combine in place to avoid making full-size temporary arrays.
+        fft_mom0 *= term2
+        term1 -= fft_mom0
 
-        # Shift to the center
-        mvc_fft = fftshift(mvc_fft)
+        # The half-spectrum is real, so the square is the same as the squared
+        # abs. Square before expanding, then shift only the final power
+        # spectrum to the center.
+        term1 *= term1
 
-        self._ps2D = np.abs(mvc_fft) ** 2.
+        self._ps2D = fftshift(expand_rfft(term1, self.shape[-1]))
 
         if beam_correct:
             self.compute_beam_pspec()
@@ -1218,7 +1218,7 @@ class PCA_Distance(object):
 
 
 def brunt_index_correct(alpha):
-    '''
+    r'''
     Apply empirical corrections from Heyer & Brunt
 
     Using the empirical correction from Brunt & Heyer 2002a, where
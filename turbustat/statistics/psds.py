@@ -2,6 +2,8 @@
 from __future__ import print_function, absolute_import, division
 
 import numpy as np
+from functools import lru_cache
+from scipy import ndimage
 from scipy.stats import binned_statistic
 import astropy.units as u
 from astropy.coordinates import Angle
@@ -13,7 +15,10 @@ def pspec(psd2, nbins=None, return_stddev=False, binsize=1.0,
           theta_0=None, delta_theta=None, boot_iter=None,
           mean_func=np.nanmean):
     '''
-    Calculate the radial profile using scipy.stats.binned_statistic.
+    Calculate the radial profile. The bin of each pixel is cached for the
+    shape and binning. By default, the mean and standard deviation in each
+    bin are computed with `scipy.ndimage`; other `mean_func` and bootstrap
+    estimates use `scipy.stats.binned_statistic`.
 
     Parameters
     ----------
@@ -58,14 +63,13 @@ def pspec(psd2, nbins=None, return_stddev=False, binsize=1.0,
         within each of the bins.
     '''
 
-    yy, xx = make_radial_arrays(psd2.shape)
-
-    dists = np.sqrt(yy**2 + xx**2)
     if theta_0 is not None:
 
         if delta_theta is None:
             raise ValueError("Must give delta_theta.")
 
+        yy, xx = make_radial_arrays(psd2.shape)
+
         theta_0 = theta_0.to(u.rad)
         delta_theta = delta_theta.to(u.rad)
 
@@ -78,22 +82,18 @@ def pspec(psd2, nbins=None, return_stddev=False, binsize=1.0,
         # Wrap around pi
         theta_limits = theta_limits.wrap_at(np.pi * u.rad)
 
-    if nbins is None:
-        nbins = int(np.round(dists.max() / binsize) + 1)
-
-    if return_freqs:
-        yy_freq, xx_freq = make_radial_freq_arrays(psd2.shape)
-
-        freqs_dist = np.sqrt(yy_freq**2 + xx_freq**2)
+    # Largest distance from the centre pixel (see make_radial_arrays)
+    max_dist = np.sqrt((psd2.shape[0] // 2)**2 + (psd2.shape[1] // 2)**2)
 
-        zero_freq_val = freqs_dist[np.nonzero(freqs_dist)].min() / 2.
-        freqs_dist[freqs_dist == 0] = zero_freq_val
+    if nbins is None:
+        nbins = np.round(max_dist / binsize) + 1
+    nbins = int(nbins)
 
     if max_bin is None:
         if return_freqs:
             max_bin = 0.5
         else:
-            max_bin = dists.max()
+            max_bin = max_dist
 
     if min_bin is None:
         if return_freqs:
@@ -101,15 +101,12 @@ def pspec(psd2, nbins=None, return_stddev=False, binsize=1.0,
         else:
             min_bin = 0.5
 
-    if logspacing:
-        bins = np.logspace(np.log10(min_bin), np.log10(max_bin), nbins + 1)
-    else:
-        bins = np.linspace(min_bin, max_bin, nbins + 1)
+    dist_arr = _radial_dists(psd2.shape, bool(return_freqs))
 
-    if return_freqs:
-        dist_arr = freqs_dist
-    else:
-        dist_arr = dists
+    bins, bin_labels = _radial_bin_labels(psd2.shape, nbins,
+                                          float(min_bin), float(max_bin),
+                                          bool(logspacing),
+                                          bool(return_freqs))
 
     if theta_0 is not None:
         if theta_limits[0] < theta_limits[1]:
@@ -122,8 +119,8 @@ def pspec(psd2, nbins=None, return_stddev=False, binsize=1.0,
         azim_mask = np.logical_or(azim_mask, azim_mask[::-1, ::-1])
 
         # Fill in the middle angles
-        ny = np.floor(psd2.shape[0] / 2.).astype(int)
-        nx = np.floor(psd2.shape[1] / 2.).astype(int)
+        ny = psd2.shape[0] // 2
+        nx = psd2.shape[1] // 2
 
         azim_mask[ny - 1:ny + 1, nx - 1:nx + 1] = True
     else:
@@ -133,12 +130,24 @@ def pspec(psd2, nbins=None, return_stddev=False, binsize=1.0,
     if azim_mask is not None:
         finite_mask = np.logical_and(finite_mask, azim_mask)
 
-    ps1D, bin_edge, cts = binned_statistic(dist_arr[finite_mask].ravel(),
-                                           psd2[finite_mask].ravel(),
-                                           bins=bins,
-                                           statistic=mean_func)
+    finite_vals = psd2[finite_mask]
+    finite_labels = bin_labels[finite_mask]
+    bin_index = np.arange(1, nbins + 1)
+
+    # The default mean and standard deviation reduce directly over the
+    # cached bin labels. Other functions fall back to binned_statistic.
+    # ndimage cannot reduce over an empty set of labels.
+    if finite_vals.size == 0:
+        ps1D = np.full(nbins, np.NaN)
+    elif mean_func is np.nanmean or mean_func is np.mean:
+        with np.errstate(invalid='ignore', divide='ignore'):
+            ps1D = np.asarray(ndimage.mean(finite_vals, labels=finite_labels,
+                                           index=bin_index), dtype=float)
+    else:
+        ps1D = binned_statistic(dist_arr[finite_mask], finite_vals,
+                                bins=bins, statistic=mean_func)[0]
 
-    bin_cents = (bin_edge[1:] + bin_edge[:-1]) / 2.
+    bin_cents = (bins[1:] + bins[:-1]) / 2.
 
     if not return_stddev:
         if theta_0 is not None:
@@ -147,9 +156,22 @@ def pspec(psd2, nbins=None, return_stddev=False, binsize=1.0,
             return bin_cents, ps1D
     else:
 
-        if boot_iter is None:
+        bin_cts = np.bincount(finite_labels.ravel(),
+                              minlength=nbins + 2)[1:nbins + 1]
 
-            stat_func = lambda x: np.nanstd(x, ddof=1)
+        if finite_vals.size == 0:
+            ps1D_stddev = np.full(nbins, np.NaN)
+
+        elif boot_iter is None:
+
+            # Convert to the sample standard deviation (ddof=1)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                ps1D_stddev = \
+                    np.asarray(ndimage.standard_deviation(finite_vals,
+                                                          labels=finite_labels,
+                                                          index=bin_index),
+                               dtype=float)
+                ps1D_stddev *= np.sqrt(bin_cts / (bin_cts - 1.))
 
         else:
             from astropy.stats import bootstrap
@@ -157,17 +179,10 @@ def pspec(psd2, nbins=None, return_stddev=False, binsize=1.0,
             stat_func = lambda data: np.mean(bootstrap(data, boot_iter,
                                                        bootfunc=np.std))
 
-        ps1D_stddev = binned_statistic(dist_arr[finite_mask].ravel(),
-                                       psd2[finite_mask].ravel(),
-                                       bins=bins,
-                                       statistic=stat_func)[0]
-
-        # We're dealing with variations in the number of samples for each bin.
-        # Add a correction based on the t distribution
-        bin_cts = binned_statistic(dist_arr[finite_mask].ravel(),
-                                   psd2[finite_mask].ravel(),
-                                   bins=bins,
-                                   statistic='count')[0]
+            ps1D_stddev = binned_statistic(dist_arr[finite_mask],
+                                           finite_vals,
+                                           bins=bins,
+                                           statistic=stat_func)[0]
 
         # Two-tail CI for 85% (~1 sigma)
         alpha = 1 - (0.15 / 2.)
@@ -193,15 +208,72 @@ def pspec(psd2, nbins=None, return_stddev=False, binsize=1.0,
             return bin_cents, ps1D, ps1D_stddev
 
 
+@lru_cache(maxsize=4)
+def _radial_dists(shape, return_freqs):
+    '''
+    Return the distance of each pixel from the centre, either in pixels or
+    as a spatial frequency. The zero frequency is replaced by half of the
+    smallest non-zero frequency.
+
+    The array is cached and returned as read-only.
+    '''
+
+    if return_freqs:
+        yy_freq, xx_freq = make_radial_freq_arrays(shape)
+
+        dist_arr = np.sqrt(yy_freq**2 + xx_freq**2)
+
+        zero_freq_val = dist_arr[np.nonzero(dist_arr)].min() / 2.
+        dist_arr[dist_arr == 0] = zero_freq_val
+    else:
+        yy, xx = make_radial_arrays(shape)
+
+        dist_arr = np.sqrt(yy**2 + xx**2)
+
+    dist_arr.flags.writeable = False
+
+    return dist_arr
+
+
+@lru_cache(maxsize=4)
+def _radial_bin_labels(shape, nbins, min_bin, max_bin, logspacing,
+                       return_freqs):
+    '''
+    Return the bin edges and the bin number of every pixel for the radial
+    profile. Bins are numbered from 1 to nbins; pixels outside of the bins
+    are 0 or nbins + 1. The binning follows `scipy.stats.binned_statistic`.
+
+    The arrays are cached and returned as read-only.
+    '''
+
+    dist_arr = _radial_dists(shape, return_freqs)
+
+    if logspacing:
+        bins = np.logspace(np.log10(min_bin), np.log10(max_bin), nbins + 1)
+    else:
+        bins = np.linspace(min_bin, max_bin, nbins + 1)
+
+    bin_labels = binned_statistic(dist_arr.ravel(), dist_arr.ravel(),
+                                  bins=bins,
+                                  statistic='count').binnumber
+    # Bin numbers are at most nbins + 1
+    bin_labels = bin_labels.reshape(shape).astype(np.int32)
+
+    bins.flags.writeable = False
+    bin_labels.flags.writeable = False
+
+    return bins, bin_labels
+
+
 def make_radial_arrays(shape, y_center=None, x_center=None):
 
     if y_center is None:
-        y_center = np.floor(shape[0] / 2.).astype(int)
+        y_center = shape[0] // 2
     else:
         y_center = int(y_center)
 
     if x_center is None:
-        x_center = np.floor(shape[1] / 2.).astype(int)
+        x_center = shape[1] // 2
     else:
         x_center = int(x_center)
 
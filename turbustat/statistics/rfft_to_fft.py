@@ -3,9 +3,12 @@ from __future__ import print_function, absolute_import, division
 
 import numpy as np
 from warnings import warn
+from functools import lru_cache
+from threading import Lock
 
 try:
-    from pyfftw.interfaces.numpy_fft import rfftn
+    import pyfftw
+    from pyfftw.builders import rfftn as build_rfftn
     PYFFTW_FLAG = True
 except ImportError:
     PYFFTW_FLAG = False
@@ -19,7 +22,7 @@ http://stackoverflow.com/questions/25147045/full-frequency-array-reconstruction-
 
 
 def rfft_to_fft(image, keep_rfft=False, use_pyfftw=False,
-                threads=1, **pyfftw_kwargs):
+                threads=1, axes=None, **pyfftw_kwargs):
     '''
     Perform a RFFT on the image (2 or 3D) and return the absolute value in
     the same format as you would get with the fft (negative frequencies).
@@ -36,7 +39,14 @@ def rfft_to_fft(image, keep_rfft=False, use_pyfftw=False,
         Try using pyfftw for the FFT.
     threads : int, optional
         Number of threads to use when using pyfftw. Default is 1.
-    pyfftw_kwargs : Passed to `~pyfftw.interfaces.numpy_fft.rfftn`.
+    axes : tuple, optional
+        Axes to compute the FFT over. Defaults to all axes. The only other
+        option is `axes=(1, 2)` for a 3D image, which computes the 2D FFT
+        of each channel of a cube in one batched transform.
+    pyfftw_kwargs : Passed to `~pyfftw.builders.rfftn`. The plan is cached
+        and re-used for arrays with the same shape and type. Give
+        `planner_effort='FFTW_MEASURE'` when transforming many arrays of
+        the same shape.
 
     Outputs
     -------
@@ -48,26 +58,86 @@ def rfft_to_fft(image, keep_rfft=False, use_pyfftw=False,
     if ndim < 2 or ndim > 3:
         raise TypeError("Dimension of image must be 2D or 3D.")
 
+    axes = _check_axes(axes, ndim)
+
     last_dim = image.shape[-1]
 
     if use_pyfftw:
         if PYFFTW_FLAG:
-            fft_abs = np.abs(rfftn(image, **pyfftw_kwargs))
+            plan, plan_lock = \
+                _pyfftw_rfftn_plan(image.shape, image.dtype.str, threads,
+                                   axes,
+                                   tuple(sorted(pyfftw_kwargs.items())))
+
+            with plan_lock:
+                fft_abs = np.abs(plan(image))
         else:
             use_pyfftw = False
             warn("pyfftw is not installed")
 
     if not use_pyfftw:
-        fft_abs = np.abs(np.fft.rfftn(image))
+        fft_abs = np.abs(np.fft.rfftn(image, axes=axes))
 
     if keep_rfft:
         return fft_abs
 
+    return expand_rfft(fft_abs, last_dim, axes=axes)
+
+
+@lru_cache(maxsize=2)
+def _pyfftw_rfftn_plan(shape, dtype, threads, axes, pyfftw_kwargs):
+    '''
+    Build a pyfftw RFFT plan for the given shape and data type. Plans are
+    cached so that repeated transforms of the same shape (e.g., the two
+    data sets in a distance metric) skip the planning step. Each plan owns
+    input and output arrays the size of the data, so only the last two
+    plans are kept.
+
+    A plan re-uses its internal arrays, so it is returned with a lock that
+    must be held while it is executed.
+    '''
+
+    template = pyfftw.empty_aligned(shape, dtype=dtype)
+
+    plan = build_rfftn(template, axes=axes, threads=threads,
+                       **dict(pyfftw_kwargs))
+
+    return plan, Lock()
+
+
+def expand_rfft(fft_abs, last_dim, axes=None):
+    '''
+    Expand the absolute value of a RFFT output (2 or 3D) to the negative
+    frequencies of the full FFT.
+
+    Inputs
+    ------
+    fft_abs : numpy.ndarray
+        Absolute value of the RFFT output, e.g., from `rfft_to_fft` with
+        `keep_rfft=True`.
+    last_dim : int
+        Size of the last axis of the array the RFFT was computed from.
+    axes : tuple, optional
+        Axes the RFFT was computed over. Defaults to all axes. The only
+        other option is `axes=(1, 2)` for a 3D array.
+
+    Outputs
+    -------
+    fft_abs : absolute value of the full fft.
+    '''
+
+    ndim = len(fft_abs.shape)
+
+    if ndim < 2 or ndim > 3:
+        raise TypeError("Dimension of image must be 2D or 3D.")
+
+    axes = _check_axes(axes, ndim)
+
     if ndim == 2:
         if last_dim % 2 == 0:
-            fftstar_abs = fft_abs.copy()[:, -2:0:-1]
+            fftstar_abs = fft_abs[:, -2:0:-1].copy()
         else:
-            fftstar_abs = fft_abs.copy()[:, -1:0:-1]
+            fftstar_abs = fft_abs[:, -1:0:-1].copy()
 
         fftstar_abs[1::, :] = fftstar_abs[:0:-1, :]
 
@@ -75,11 +145,37 @@ def rfft_to_fft(image, keep_rfft=False, use_pyfftw=False,
 
     elif ndim == 3:
         if last_dim % 2 == 0:
-            fftstar_abs = fft_abs.copy()[:, :, -2:0:-1]
+            fftstar_abs = fft_abs[:, :, -2:0:-1].copy()
         else:
-            fftstar_abs = fft_abs.copy()[:, :, -1:0:-1]
+            fftstar_abs = fft_abs[:, :, -1:0:-1].copy()
 
-        fftstar_abs[1::, :, :] = fftstar_abs[:0:-1, :, :]
+        # Channels are only mirrored when the FFT was taken along them.
+        if axes is None:
+            fftstar_abs[1::, :, :] = fftstar_abs[:0:-1, :, :]
         fftstar_abs[:, 1::, :] = fftstar_abs[:, :0:-1, :]
 
         return np.concatenate((fft_abs, fftstar_abs), axis=2)
+
+
+def _check_axes(axes, ndim):
+    '''
+    Check that the FFT axes are supported by `expand_rfft`. Returns None
+    when all axes are transformed and (1, 2) for the spatial axes of a cube.
+    '''
+
+    if axes is None:
+        return None
+
+    axes = tuple(axes)
+
+    if all(-ndim <= ax < ndim for ax in axes):
+        axes = tuple(ax % ndim for ax in axes)
+
+        if axes == tuple(range(ndim)):
+            return None
+
+        if ndim == 3 and axes == (1, 2):
+            return axes
+
+    raise ValueError("axes must be None or the last two axes of a 3D "
+                     "array. Got {}.".format(axes))
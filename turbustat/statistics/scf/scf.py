@@ -9,6 +9,8 @@ import statsmodels.api as sm
 from warnings import warn
 from astropy.utils.console import ProgressBar
 from itertools import product
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 from ..psds import pspec, make_radial_arrays
 from ..base_statistic import BaseStatisticMixIn
@@ -20,6 +22,12 @@ from ..elliptical_powerlaw import (fit_elliptical_powerlaw,
                                    inverse_interval_transform_stderr)
 from ..stats_warnings import TurbuStatMetricWarning
 
+try:
+    from numba import njit, prange
+    NUMBA_FLAG = True
+except ImportError:
+    NUMBA_FLAG = False
+
 
 class SCF(BaseStatisticMixIn):
     '''
@@ -148,7 +156,8 @@ class SCF(BaseStatisticMixIn):
         '''
         return self._lags
 
-    def compute_surface(self, boundary='continuous', show_progress=True):
+    def compute_surface(self, boundary='continuous', show_progress=True,
+                        use_numba=False, dtype=None):
         '''
         Computes the SCF up to the given lag value. This is an
         expensive operation and could take a long time to calculate.
@@ -160,6 +169,14 @@ class SCF(BaseStatisticMixIn):
             beyond the edge (i.e., for most observational data).
         show_progress : bool, optional
             Show a progress bar when computing the surface. =
+        use_numba : bool, optional
+            Compute the surface with a compiled, multi-threaded kernel, if
+            numba is installed. Only integer pixel lags are supported. No
+            progress bar is shown, so `show_progress` is ignored.
+        dtype : `~numpy.dtype`, optional
+            Data type to compute the surface with. Defaults to the data type
+            of the cube. `np.float32` halves the memory traffic for large
+            cubes, with small differences in the SCF values.
         '''
 
         if boundary not in ["continuous", "cut"]:
@@ -173,6 +190,69 @@ class SCF(BaseStatisticMixIn):
         dx = pix_lags.copy()
         dy = pix_lags.copy()
 
+        if dtype is None:
+            data = self.data
+        else:
+            data = self.data.astype(dtype, copy=False)
+
+        if use_numba:
+            if not NUMBA_FLAG:
+                use_numba = False
+                warn("numba is not installed.")
+            elif not (np.mod(pix_lags, 1) == 0).all():
+                use_numba = False
+                warn("use_numba requires integer pixel lags. Computing the"
+                     " surface without numba.")
+
+        if use_numba:
+            nx, ny = data.shape[1:]
+
+            lag_params = np.empty((len(dx) * len(dy), 6), dtype=np.int64)
+            for n, (x_shift, y_shift) in enumerate(product(dx, dy)):
+                lag_params[n] = _lag_bounds(x_shift, nx, boundary) + \
+                    _lag_bounds(y_shift, ny, boundary)
+
+            # numba only accepts native byte order (FITS data is big-endian)
+            data = np.ascontiguousarray(data,
+                                        dtype=data.dtype.newbyteorder('='))
+
+            scf_values = np.empty(len(lag_params))
+            _scf_surface_kernel(data, lag_params, scf_values)
+
+            if (scf_values > 1).any():
+                raise ValueError("Cannot have a correlation above 1. Check "
+                                 "your input data. Contact the TurbuStat "
+                                 "authors if the problem persists.")
+
+            # Lags are ordered with the x shift varying slowest.
+            self._scf_surface = scf_values.reshape((len(dx), len(dy))).T
+
+            return
+
+        # The squared sum of the unshifted data does not depend on the lag.
+        data_sq_sum = np.nansum(data ** 2, axis=0)
+
+        # Integer lags are taken as views into a single wrap-padded copy of
+        # the data. This is equivalent to np.roll, but avoids copying the
+        # whole cube for every lag.
+        int_lags = np.abs(pix_lags[np.mod(pix_lags, 1) == 0])
+        pad = int(int_lags.max()) if int_lags.size > 0 else 0
+        padded = np.pad(data, ((0, 0), (pad, pad), (pad, pad)),
+                        mode='wrap')
+        nx, ny = data.shape[1:]
+
+        # Buffers for the squared terms in each lag. These are re-used to
+        # avoid allocating several temporary cubes for every lag.
+        sq_buffer = np.empty(data.shape,
+                             dtype=np.result_type(data.dtype, np.float32))
+        nan_buffer = np.empty(data.shape, dtype=bool)
+
+        # With a continuous boundary, the SCF at integer lags is symmetric:
+        # the pixel pairs at lag -s are the pairs at lag s, assigned to the
+        # other pixel of each pair. Each surface value is the mean over all
+        # pixels, so values for -s are re-used from s when already computed.
+        periodic_values = {}
+
         if show_progress:
             bar = ProgressBar(len(dx) * len(dy))
 
@@ -183,23 +263,41 @@ class SCF(BaseStatisticMixIn):
             if x_shift == 0 and y_shift == 0:
                 self._scf_surface[j, i] = 1.
 
-            if x_shift == 0:
-                tmp = self.data
-            else:
+            # The shift along the first spatial axis is the same for each
+            # row of lags. Only compute it once per row, since it requires
+            # an FFT of the whole cube for non-integer lags.
+            if j == 0:
                 if float(x_shift).is_integer():
-                    shift_func = pixel_shift
+                    x_start = pad - int(x_shift)
+                    tmp_x = padded[:, x_start:x_start + nx, pad:pad + ny]
                 else:
-                    shift_func = fourier_shift
-                tmp = shift_func(self.data, x_shift, axis=1)
+                    tmp_x = fourier_shift(data, x_shift, axis=1)
+
+            is_periodic = boundary == "continuous" and \
+                float(x_shift).is_integer() and float(y_shift).is_integer()
+
+            if is_periodic and (-x_shift, -y_shift) in periodic_values:
+                self._scf_surface[j, i] = \
+                    periodic_values[(-x_shift, -y_shift)]
+
+                if show_progress:
+                    bar.update(n + 1)
 
-            if y_shift != 0:
+                continue
+
+            if float(x_shift).is_integer() and float(y_shift).is_integer():
+                y_start = pad - int(y_shift)
+                tmp = padded[:, x_start:x_start + nx, y_start:y_start + ny]
+            elif y_shift == 0:
+                tmp = tmp_x
+            else:
                 if float(y_shift).is_integer():
                     shift_func = pixel_shift
                 else:
                     shift_func = fourier_shift
-                tmp = shift_func(tmp, y_shift, axis=2)
+                tmp = shift_func(tmp_x, y_shift, axis=2)
 
-            if boundary is "cut":
+            if boundary == "cut":
                 # Always round up to the nearest integer.
                 x_shift = np.ceil(x_shift).astype(int)
                 y_shift = np.ceil(y_shift).astype(int)
@@ -219,15 +317,26 @@ class SCF(BaseStatisticMixIn):
 
                 data_slice = (slice(None), x_slice_data, y_slice_data)
                 tmp_slice = (slice(None), x_slice_tmp, y_slice_tmp)
-            elif boundary is "continuous":
+            elif boundary == "continuous":
                 data_slice = (slice(None),) * 3
                 tmp_slice = (slice(None),) * 3
 
-            values = \
-                np.nansum(((self.data[data_slice] - tmp[tmp_slice]) ** 2),
-                          axis=0) / \
-                (np.nansum(self.data[data_slice] ** 2, axis=0) +
-                 np.nansum(tmp[tmp_slice] ** 2, axis=0))
+            data_view = data[data_slice]
+            tmp_view = tmp[tmp_slice]
+
+            buff_slice = (slice(None),) + \
+                tuple(slice(None, npix) for npix in data_view.shape[1:])
+            buff = sq_buffer[buff_slice]
+            isnan = nan_buffer[buff_slice]
+
+            np.subtract(data_view, tmp_view, out=buff)
+            np.multiply(buff, buff, out=buff)
+            diff_sq_sum = _nansum_inplace(buff, isnan)
+
+            np.multiply(tmp_view, tmp_view, out=buff)
+            tmp_sq_sum = _nansum_inplace(buff, isnan)
+
+            values = diff_sq_sum / (data_sq_sum[data_slice[1:]] + tmp_sq_sum)
 
             scf_value = 1. - \
                 np.sqrt(np.nansum(values) / np.sum(np.isfinite(values)))
@@ -239,6 +348,9 @@ class SCF(BaseStatisticMixIn):
 
             self._scf_surface[j, i] = scf_value
 
+            if is_periodic:
+                periodic_values[(x_shift, y_shift)] = scf_value
+
             if show_progress:
                 bar.update(n + 1)
 
@@ -750,7 +862,8 @@ class SCF(BaseStatisticMixIn):
             show_progress=True, xlow=None, xhigh=None,
             fit_kwargs={}, fit_2D=True,
             fit_2D_kwargs={}, radialavg_kwargs={},
-            verbose=False, xunit=u.pix, save_name=None):
+            verbose=False, xunit=u.pix, save_name=None,
+            use_numba=False, dtype=None):
         '''
         Computes all SCF outputs.
 
@@ -781,9 +894,14 @@ class SCF(BaseStatisticMixIn):
             Choose the angular unit to convert to when ang_units is enabled.
         save_name : str, optional
             Save the figure when a file name is given.
+        use_numba : bool, optional
+            See `~SCF.compute_surface`.
+        dtype : `~numpy.dtype`, optional
+            See `~SCF.compute_surface`.
         '''
 
-        self.compute_surface(boundary=boundary, show_progress=show_progress)
+        self.compute_surface(boundary=boundary, show_progress=show_progress,
+                             use_numba=use_numba, dtype=dtype)
         self.compute_spectrum(**radialavg_kwargs)
         self.fit_plaw(verbose=verbose, xlow=xlow, xhigh=xhigh, **fit_kwargs)
 
@@ -797,6 +915,110 @@ class SCF(BaseStatisticMixIn):
         return self
 
 
+def _nansum_inplace(arr, isnan):
+    '''
+    Equivalent to `np.nansum(arr, axis=0)`, but the NaNs are set to zero in
+    `arr` using the boolean buffer `isnan`, rather than in a copy of `arr`.
+    '''
+
+    np.isnan(arr, out=isnan)
+    np.copyto(arr, 0., where=isnan)
+
+    return arr.sum(axis=0)
+
+
+def _lag_bounds(shift, npix, boundary):
+    '''
+    Return the range of pixels along one axis that are compared for an integer
+    lag, and the offset to the pixel they are compared to (wrapped around the
+    edge). Matches the slicing of the shifted data in `SCF.compute_surface`.
+    '''
+
+    shift = int(shift)
+
+    if boundary == "continuous":
+        return (0, npix, shift)
+
+    if shift < 0:
+        return (0, npix + shift, 2 * shift)
+
+    return (shift, npix, 2 * shift)
+
+
+if NUMBA_FLAG:
+
+    @njit(parallel=True, cache=True, error_model='numpy')
+    def _scf_surface_kernel(data, lag_params, out):
+        '''
+        Compute the SCF value for each set of integer lags. Each row of
+        `lag_params` gives the start, end and offset along both spatial axes
+        (see `_lag_bounds`). NaNs are ignored, as with `np.nansum`.
+        '''
+
+        nchan, nx, ny = data.shape
+
+        for n in prange(lag_params.shape[0]):
+            x_lo = lag_params[n, 0]
+            x_hi = lag_params[n, 1]
+            x_off = lag_params[n, 2]
+            y_lo = lag_params[n, 3]
+            y_hi = lag_params[n, 4]
+            y_off = lag_params[n, 5]
+
+            num = np.zeros((x_hi - x_lo, y_hi - y_lo))
+            den = np.zeros((x_hi - x_lo, y_hi - y_lo))
+
+            for c in range(nchan):
+                for k1 in range(x_lo, x_hi):
+                    t1 = (k1 - x_off) % nx
+                    for k2 in range(y_lo, y_hi):
+                        t2 = (k2 - y_off) % ny
+
+                        val = data[c, k1, k2]
+                        val_shift = data[c, t1, t2]
+
+                        if not np.isnan(val):
+                            den[k1 - x_lo, k2 - y_lo] += val * val
+                        if not np.isnan(val_shift):
+                            den[k1 - x_lo, k2 - y_lo] += val_shift * val_shift
+                            if not np.isnan(val):
+                                diff = val - val_shift
+                                num[k1 - x_lo, k2 - y_lo] += diff * diff
+
+            total = 0.
+            count = 0
+            for k1 in range(x_hi - x_lo):
+                for k2 in range(y_hi - y_lo):
+                    value = num[k1, k2] / den[k1, k2]
+                    if np.isfinite(value):
+                        total += value
+                        count += 1
+
+            out[n] = 1. - np.sqrt(total / count)
+
+
+@lru_cache(maxsize=8)
+def _scf_distance_weights(size, weighted):
+    '''
+    Weights for the SCF distance. These only depend on the number of lags, so
+    are cached and returned as a read-only array.
+    '''
+
+    lags = np.arange(size) - size // 2
+
+    a, b = np.meshgrid(lags, lags)
+    if weighted:
+        dist_weight = 1 / np.sqrt(a ** 2 + b ** 2)
+        # Centre pixel set to 1
+        dist_weight[np.where((a == 0) & (b == 0))] = 1.
+    else:
+        dist_weight = np.ones((size, size))
+
+    dist_weight.setflags(write=False)
+
+    return dist_weight
+
+
 class SCF_Distance(object):
 
     '''
@@ -824,12 +1046,18 @@ class SCF_Distance(object):
         beyond the edge (i.e., for most observational data). A two element
         list can also be passed for treating the boundaries differently
         between the given cubes.
+    show_progress : bool, optional
+        Show a progress bar when computing the SCF surfaces. Disabled when
+        `parallel=True`.
+    parallel : bool, optional
+        Compute the SCF surfaces of both cubes at the same time in two
+        threads.
     '''
 
     __doc__ %= {"dtypes": " or ".join(common_types + threed_types)}
 
     def __init__(self, cube1, cube2, size=11, boundary='continuous',
-                 show_progress=True):
+                 show_progress=True, parallel=False):
 
         if isinstance(cube1, SCF):
             self.scf1 = cube1
@@ -881,55 +1109,61 @@ class SCF_Distance(object):
         #     self.scf1 = fiducial_model
         if _has_data1:
             self.scf1 = SCF(cube1, roll_lags=roll_lags1)
-            needs_run = True
+            needs_run1 = True
         else:
-            needs_run = False
+            needs_run1 = False
             lag_check = (roll_lags1 == self.scf1.roll_lags).all()
             compute_check = hasattr(self.scf1, "_scf_spectrum")
             if not lag_check:
                 warn("SCF given as cube1 needs to be recomputed as the lags"
                      " must match the common set of lags between the two data"
                      " sets. Recomputing SCF.")
-                needs_run = True
+                needs_run1 = True
                 self.scf1.roll_lags = roll_lags1
 
             if not compute_check:
                 warn("SCF given as cube1 does not have an SCF"
                      " spectrum computed. Recomputing SCF.")
-                needs_run = True
-
-        if needs_run:
-            self.scf1.compute_surface(boundary=boundary[0],
-                                      show_progress=show_progress)
-            # This is for the plot, not the distance, so stick with default
-            # params
-            self.scf1.compute_spectrum()
+                needs_run1 = True
 
         if _has_data2:
             self.scf2 = SCF(cube2, roll_lags=roll_lags2)
-            needs_run = True
+            needs_run2 = True
         else:
-            needs_run = False
+            needs_run2 = False
             lag_check = (roll_lags2 == self.scf2.roll_lags).all()
             compute_check = hasattr(self.scf2, "_scf_spectrum")
             if not lag_check:
                 warn("SCF given as cube2 needs to be recomputed as the lags"
                      " must match the common set of lags between the two data"
                      " sets. Recomputing SCF.")
-                needs_run = True
+                needs_run2 = True
                 self.scf2.roll_lags = roll_lags2
 
             if not compute_check:
                 warn("SCF given as cube2 does not have an SCF"
                      " spectrum computed. Recomputing SCF.")
-                needs_run = True
+                needs_run2 = True
 
-        if needs_run:
-            self.scf2.compute_surface(boundary=boundary[1],
-                                      show_progress=show_progress)
+        parallel = parallel and needs_run1 and needs_run2
+
+        def run_scf(scf, bound):
+            scf.compute_surface(boundary=bound,
+                                show_progress=show_progress and not parallel)
             # This is for the plot, not the distance, so stick with default
             # params
-            self.scf2.compute_spectrum()
+            scf.compute_spectrum()
+
+        if parallel:
+            # The SCF instances are independent and the work in the lag loop
+            # is done in numpy calls that release the GIL.
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                list(executor.map(run_scf, [self.scf1, self.scf2], boundary))
+        else:
+            if needs_run1:
+                run_scf(self.scf1, boundary[0])
+            if needs_run2:
+                run_scf(self.scf2, boundary[1])
 
     def distance_metric(self, weighted=True, verbose=False,
                         plot_kwargs1={'color': 'b', 'marker': 'D',
@@ -962,19 +1196,11 @@ class SCF_Distance(object):
         # Since the angular scales are matched, we can assume that they will
         # have the same weights. So just use the shape of the lags to create
         # the weight surface.
-        dx = np.arange(self.size) - self.size // 2
-        dy = np.arange(self.size) - self.size // 2
-
-        a, b = np.meshgrid(dx, dy)
-        if weighted:
-            dist_weight = 1 / np.sqrt(a ** 2 + b ** 2)
-            # Centre pixel set to 1
-            dist_weight[np.where((a == 0) & (b == 0))] = 1.
-        else:
-            dist_weight = np.ones((self.size, self.size))
+        dist_weight = _scf_distance_weights(self.size, weighted)
 
-        difference = (self.scf1.scf_surface - self.scf2.scf_surface) ** 2. * \
-            dist_weight
+        difference = self.scf1.scf_surface - self.scf2.scf_surface
+        difference *= difference
+        difference *= dist_weight
         self.distance = np.sqrt(np.sum(difference) / np.sum(dist_weight))
 
         if verbose:
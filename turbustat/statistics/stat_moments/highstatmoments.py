@@ -243,7 +243,7 @@ class StatMoments(BaseStatisticMixIn):
 
     def make_spatial_histograms(self, mean_bins=None, variance_bins=None,
                                 skewness_bins=None, kurtosis_bins=None):
-        '''
+        r'''
         Create histograms of the moments. If an optional set of bins is not
         given, :math:`\sqrt{N}` equally-size bins will be created, where
         :math:`N` is the number of elements in the array. The histogram
@@ -4,9 +4,10 @@ from __future__ import print_function, absolute_import, division
 import numpy as np
 import warnings
 from numpy.fft import fftshift
+from concurrent.futures import ThreadPoolExecutor
 import astropy.units as u
 
-from ..rfft_to_fft import rfft_to_fft
+from ..rfft_to_fft import rfft_to_fft, expand_rfft
 from .slice_thickness import spectral_regrid_cube
 from ..base_pspec2 import StatisticBase_PSpec2D
 from ..base_statistic import BaseStatisticMixIn
@@ -61,8 +62,12 @@ class VCA(BaseStatisticMixIn, StatisticBase_PSpec2D):
 
         isnan = np.isnan(self.data)
         if isnan.any():
-            self.data = self.data.copy()
-            self.data[isnan] = 0.0
+            if channel_width is None:
+                # Avoid altering the input data. Copy and fill in one pass.
+                self.data = np.where(isnan, 0.0, self.data)
+            else:
+                # The regridded data is already a new array.
+                self.data[isnan] = 0.0
 
         if distance is not None:
             self.distance = distance
@@ -111,11 +116,20 @@ class VCA(BaseStatisticMixIn, StatisticBase_PSpec2D):
         if pyfftw_kwargs.get('threads') is not None:
             pyfftw_kwargs.pop('threads')
 
-        fft = fftshift(rfft_to_fft(data, use_pyfftw=use_pyfftw,
-                                   threads=threads,
-                                   **pyfftw_kwargs))
+        # Only the spatial axes are transformed, as one batched FFT over the
+        # channels. Summed over the channels, the power of the full 3D FFT
+        # equals the summed power of the 2D FFTs times the number of
+        # channels (Parseval's theorem along the spectral axis).
+        fft = rfft_to_fft(data, keep_rfft=True, use_pyfftw=use_pyfftw,
+                          threads=threads, axes=(1, 2),
+                          **pyfftw_kwargs)
+
+        # Sum the power over the channels on the half-spectrum. Only the 2D
+        # sum needs to be expanded to the full FFT shape and shifted.
+        power = np.einsum('cij,cij->ij', fft, fft)
+        power *= data.shape[0]
 
-        self._ps2D = np.power(fft, 2.).sum(axis=0)
+        self._ps2D = fftshift(expand_rfft(power, data.shape[-1]))
 
         if beam_correct:
             self.compute_beam_pspec()
@@ -248,13 +262,16 @@ class VCA_Distance(object):
         When `None` is given, setting from `pspec_kwargs` are used for `cube2`.
     phys_distance : `~astropy.units.Quantity`, optional
         Physical distance to the region in the data.
+    parallel : bool, optional
+        Compute the VCA of both cubes at the same time in two threads.
     '''
 
     __doc__ %= {"dtypes": " or ".join(common_types + threed_types)}
 
     def __init__(self, cube1, cube2, channel_width=None, breaks=None,
                  low_cut=None, high_cut=None,
-                 radial_pspec_kwargs={}, radial_pspec_kwargs2=None):
+                 radial_pspec_kwargs={}, radial_pspec_kwargs2=None,
+                 parallel=False):
         super(VCA_Distance, self).__init__()
 
         low_cut, high_cut = check_fit_limits(low_cut, high_cut)
@@ -265,43 +282,41 @@ class VCA_Distance(object):
         if radial_pspec_kwargs2 is None:
             radial_pspec_kwargs2 = radial_pspec_kwargs
 
-        if isinstance(cube1, VCA):
-            self.vca1 = cube1
-            needs_run = False
+        pspec_kwargs = [radial_pspec_kwargs, radial_pspec_kwargs2]
 
-            if not hasattr(self.vca1, '_slope'):
-                warnings.warn("VCA class given as `cube1` does not have a"
-                              " fitted slope. Re-running VCA.")
-                needs_run = True
-        else:
-            self.vca1 = VCA(cube1, channel_width=channel_width)
-            needs_run = True
-
-        if needs_run:
-            self.vca1.run(fit_kwargs={'brk': breaks[0]},
-                          low_cut=low_cut[0],
-                          high_cut=high_cut[0],
-                          radial_pspec_kwargs=radial_pspec_kwargs,
-                          fit_2D=False)
-
-        if isinstance(cube2, VCA):
-            self.vca2 = cube2
-            needs_run = False
-
-            if not hasattr(self.vca2, '_slope'):
-                warnings.warn("VCA class given as `cube2` does not have a"
-                              " fitted slope. Re-running VCA.")
-                needs_run = True
+        vcas = []
+        needs_run = []
+        for i, cube in enumerate([cube1, cube2]):
+            if isinstance(cube, VCA):
+                vcas.append(cube)
+                needs_run.append(not hasattr(cube, '_slope'))
+
+                if needs_run[i]:
+                    warnings.warn("VCA class given as `cube{}` does not have"
+                                  " a fitted slope. Re-running VCA."
+                                  .format(i + 1))
+            else:
+                vcas.append(VCA(cube, channel_width=channel_width))
+                needs_run.append(True)
+
+        self.vca1, self.vca2 = vcas
+
+        def run_vca(i):
+            vcas[i].run(fit_kwargs={'brk': breaks[i]},
+                        low_cut=low_cut[i],
+                        high_cut=high_cut[i],
+                        radial_pspec_kwargs=pspec_kwargs[i],
+                        fit_2D=False)
+
+        if parallel and all(needs_run):
+            # The two VCA instances are independent, and most of the time
+            # is spent in the FFTs, which release the GIL.
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                list(executor.map(run_vca, range(2)))
         else:
-            self.vca2 = VCA(cube2, channel_width=channel_width)
-            needs_run = True
-
-        if needs_run:
-            self.vca2.run(fit_kwargs={'brk': breaks[1]},
-                          low_cut=low_cut[1],
-                          high_cut=high_cut[1],
-                          radial_pspec_kwargs=radial_pspec_kwargs,
-                          fit_2D=False)
+            for i in range(2):
+                if needs_run[i]:
+                    run_vca(i)
 
     def distance_metric(self, verbose=False, xunit=u.pix**-1,
                         save_name=None, plot_kwargs1={},
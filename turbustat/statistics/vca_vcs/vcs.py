@@ -142,10 +142,11 @@ class VCS(BaseStatisticMixIn):
         rfreqs = self.freqs[1:shape // 2].value
         ps1D = self.ps1D[1:shape // 2]
 
-        y = np.log10(ps1D[clip_func(rfreqs, self.low_cut.value,
-                                    self.high_cut.value)])
-        x = np.log10(rfreqs[clip_func(rfreqs, self.low_cut.value,
-                                      self.high_cut.value)])
+        clip_mask = clip_func(rfreqs, self.low_cut.value,
+                              self.high_cut.value)
+
+        y = np.log10(ps1D[clip_mask])
+        x = np.log10(rfreqs[clip_mask])
 
         if breaks is None:
             from scipy.interpolate import UnivariateSpline
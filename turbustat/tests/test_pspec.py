@@ -21,7 +21,11 @@ try:
 except ImportError:
     RADIO_BEAM_INSTALLED = False
 
+from scipy.stats import binned_statistic
+from scipy.stats import t as t_dist
+
 from ..statistics import PowerSpectrum, PSpec_Distance
+from ..statistics.psds import pspec, make_radial_freq_arrays
 from ._testing_data import (dataset1, dataset2, computed_data,
                             computed_distances)
 from ..simulator import make_extended
@@ -296,3 +300,100 @@ def test_PSpec_apod_kernel(apod_type):
              low_cut=low_cut, verbose=False)
 
     npt.assert_allclose(-plaw, test.slope, rtol=0.02)
+
+
+
+def _pspec_image(imsize=32, nnan=20):
+    rng = np.random.default_rng(4)
+
+    image = rng.lognormal(size=(imsize, imsize))
+    image.ravel()[rng.choice(image.size, nnan, replace=False)] = np.NaN
+
+    return image
+
+
+def _pspec_reference(image, mask, statistic, nbins):
+    '''
+    Radial profile computed with binned_statistic, as pspec did before
+    caching the bin labels.
+    '''
+
+    yy_freq, xx_freq = make_radial_freq_arrays(image.shape)
+    freqs_dist = np.sqrt(yy_freq**2 + xx_freq**2)
+    freqs_dist[freqs_dist == 0] = freqs_dist[freqs_dist > 0].min() / 2.
+
+    bins = np.logspace(np.log10(1.0 / min(image.shape)), np.log10(0.5),
+                       nbins + 1)
+
+    out = binned_statistic(freqs_dist[mask], image[mask], bins=bins,
+                           statistic=statistic)[0]
+    cts = binned_statistic(freqs_dist[mask], image[mask], bins=bins,
+                           statistic='count')[0]
+
+    return out, cts
+
+
+@pytest.mark.parametrize(('theta_0', 'delta_theta'),
+                         [(None, None), (30 * u.deg, 60 * u.deg)])
+def test_pspec_binned_statistic(theta_0, delta_theta):
+
+    image = _pspec_image()
+    nbins = 10
+
+    out = pspec(image, nbins=nbins, return_stddev=True, theta_0=theta_0,
+                delta_theta=delta_theta)
+
+    mask = np.isfinite(image)
+    if theta_0 is not None:
+        mask &= out[3]
+
+    ps1D, cts = _pspec_reference(image, mask, np.nanmean, nbins)
+    ps1D_stddev = _pspec_reference(image, mask,
+                                   lambda x: np.nanstd(x, ddof=1), nbins)[0]
+
+    # Standard error correction and masking applied in pspec
+    A = t_dist.ppf(1 - (0.15 / 2.), cts - 1) / np.sqrt(cts)
+    ps1D_stddev[A > 1] *= A[A > 1]
+
+    ps1D[cts <= 1] = np.NaN
+    ps1D_stddev[cts <= 1] = np.NaN
+
+    npt.assert_allclose(out[1], ps1D)
+    npt.assert_allclose(out[2], ps1D_stddev)
+
+    # Other mean functions fall back to binned_statistic
+    out_median = pspec(image, nbins=nbins, theta_0=theta_0,
+                       delta_theta=delta_theta, mean_func=np.nanmedian)
+
+    ps1D_median = _pspec_reference(image, mask, np.nanmedian, nbins)[0]
+
+    npt.assert_allclose(out_median[1], ps1D_median)
+
+
+def test_pspec_bootstrap():
+
+    image = _pspec_image()
+    nbins = 10
+
+    out = pspec(image, nbins=nbins, return_stddev=True, boot_iter=50)
+
+    ps1D, cts = _pspec_reference(image, np.isfinite(image), np.nanmean,
+                                 nbins)
+    ps1D[cts <= 1] = np.NaN
+
+    npt.assert_allclose(out[1], ps1D)
+
+    # Bins with fewer than 2 points are masked
+    assert np.isnan(out[2][cts <= 1]).all()
+    assert (out[2][cts > 1] > 0).all()
+
+
+def test_pspec_allnan():
+
+    image = np.full((16, 16), np.NaN)
+
+    out = pspec(image, nbins=5, return_stddev=True)
+
+    assert out[1].shape == (5,)
+    assert np.isnan(out[1]).all()
+    assert np.isnan(out[2]).all()
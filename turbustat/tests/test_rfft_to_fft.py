@@ -3,7 +3,7 @@ from __future__ import print_function, absolute_import, division
 
 import pytest
 
-from ..statistics.rfft_to_fft import rfft_to_fft
+from ..statistics.rfft_to_fft import rfft_to_fft, _pyfftw_rfftn_plan
 from ._testing_data import dataset1
 
 
@@ -36,6 +36,23 @@ def test_fft_to_rfft():
     npt.assert_allclose(test_fft, comp_rfft)
 
 
+def test_fft_to_rfft_spatial_axes():
+    comp_rfft = rfft_to_fft(dataset1['cube'][0], axes=(1, 2))
+
+    test_fft = np.abs(np.fft.fftn(dataset1['cube'][0], axes=(1, 2)))
+
+    npt.assert_allclose(test_fft, comp_rfft)
+
+
+@pytest.mark.parametrize(('shape', 'axes'),
+                         [((4, 6, 8), (2,)), ((4, 6, 8), (0, 2)),
+                          ((4, 6, 8), (0, 1)), ((4, 6, 8), (2, 1)),
+                          ((6, 8), (1,)), ((6, 8), (0, 3))])
+def test_fft_to_rfft_bad_axes(shape, axes):
+    with pytest.raises(ValueError):
+        rfft_to_fft(np.ones(shape), axes=axes)
+
+
 @pytest.mark.skipif("not PYFFTW_INSTALLED")
 def test_fftw():
     comp_rfft = rfft_to_fft(dataset1['moment0'][0])
@@ -47,3 +64,21 @@ def test_fftw():
 
     npt.assert_allclose(test_fft, comp_rfft_fftw)
     npt.assert_allclose(comp_rfft, comp_rfft_fftw)
+
+
+@pytest.mark.skipif("not PYFFTW_INSTALLED")
+def test_fftw_cached_plan():
+    # The second transform of the same shape uses the cached plan.
+    image1 = dataset1['moment0'][0]
+    image2 = image1[::-1].copy()
+
+    _pyfftw_rfftn_plan.cache_clear()
+
+    comp_rfft_fftw1 = rfft_to_fft(image1, use_pyfftw=True, threads=1)
+    comp_rfft_fftw2 = rfft_to_fft(image2, use_pyfftw=True, threads=1)
+
+    assert _pyfftw_rfftn_plan.cache_info().misses == 1
+    assert _pyfftw_rfftn_plan.cache_info().hits == 1
+
+    npt.assert_allclose(np.abs(np.fft.fftn(image1)), comp_rfft_fftw1)
+    npt.assert_allclose(np.abs(np.fft.fftn(image2)), comp_rfft_fftw2)
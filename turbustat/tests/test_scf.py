@@ -10,7 +10,14 @@ import astropy.units as u
 import os
 from astropy.io import fits
 
+try:
+    import numba
+    NUMBA_INSTALLED = True
+except ImportError:
+    NUMBA_INSTALLED = False
+
 from ..statistics import SCF, SCF_Distance
+from ..statistics.stats_utils import fourier_shift, pixel_shift
 from ._testing_data import (dataset1, dataset2, computed_data,
                             computed_distances)
 from ..simulator import make_extended
@@ -100,6 +107,33 @@ def test_SCF_method_noncont_boundary():
                        computed_data['scf_val_noncon_bound'])
 
 
+@pytest.mark.skipif("not NUMBA_INSTALLED")
+@pytest.mark.parametrize(('boundary', 'key'),
+                         [('continuous', 'scf_val'),
+                          ('cut', 'scf_val_noncon_bound')])
+def test_SCF_method_numba(boundary, key):
+    tester = SCF(dataset1["cube"], size=11)
+    tester.compute_surface(boundary=boundary, use_numba=True)
+
+    assert np.allclose(tester.scf_surface, computed_data[key])
+
+    # FITS data is big-endian
+    hdu = fits.PrimaryHDU(dataset1["cube"][0].astype('>f8'),
+                          dataset1["cube"][1])
+    tester_be = SCF(hdu, size=11)
+    tester_be.compute_surface(boundary=boundary, use_numba=True)
+
+    assert np.allclose(tester_be.scf_surface, computed_data[key])
+
+
+def test_SCF_method_float32():
+    tester = SCF(dataset1["cube"], size=11)
+    tester.compute_surface(boundary='continuous', dtype=np.float32)
+
+    npt.assert_allclose(tester.scf_surface, computed_data['scf_val'],
+                        rtol=1e-4)
+
+
 def test_SCF_noninteger_shift():
     # Not testing against anything, just make sure it runs w/o issue.
     rolls = np.array([-4.5, -3.0, -1.5, 0, 1.5, 3.0, 4.5]) * u.pix
@@ -108,6 +142,77 @@ def test_SCF_noninteger_shift():
     tester_nonint.run()
 
 
+def _scf_surface_reference(data, pix_lags, boundary):
+    '''
+    SCF surface computed by shifting the cube separately for every lag.
+    '''
+
+    surface = np.zeros((len(pix_lags), len(pix_lags)))
+
+    for i, x_shift in enumerate(pix_lags):
+        for j, y_shift in enumerate(pix_lags):
+
+            tmp = data
+            if x_shift != 0:
+                if float(x_shift).is_integer():
+                    tmp = pixel_shift(tmp, x_shift, axis=1)
+                else:
+                    tmp = fourier_shift(tmp, x_shift, axis=1)
+            if y_shift != 0:
+                if float(y_shift).is_integer():
+                    tmp = pixel_shift(tmp, y_shift, axis=2)
+                else:
+                    tmp = fourier_shift(tmp, y_shift, axis=2)
+
+            data_slice = (slice(None),) * 3
+            tmp_slice = (slice(None),) * 3
+
+            if boundary == "cut":
+                x_lag = int(np.ceil(x_shift))
+                y_lag = int(np.ceil(y_shift))
+
+                nx, ny = data.shape[1:]
+
+                if x_lag < 0:
+                    x_slice_data = slice(None, nx + x_lag)
+                    x_slice_tmp = slice(-x_lag, None)
+                else:
+                    x_slice_data = slice(x_lag, None)
+                    x_slice_tmp = slice(None, nx - x_lag)
+
+                if y_lag < 0:
+                    y_slice_data = slice(None, ny + y_lag)
+                    y_slice_tmp = slice(-y_lag, None)
+                else:
+                    y_slice_data = slice(y_lag, None)
+                    y_slice_tmp = slice(None, ny - y_lag)
+
+                data_slice = (slice(None), x_slice_data, y_slice_data)
+                tmp_slice = (slice(None), x_slice_tmp, y_slice_tmp)
+
+            values = \
+                np.nansum((data[data_slice] - tmp[tmp_slice]) ** 2,
+                          axis=0) / \
+                (np.nansum(data[data_slice] ** 2, axis=0) +
+                 np.nansum(tmp[tmp_slice] ** 2, axis=0))
+
+            surface[j, i] = 1. - \
+                np.sqrt(np.nansum(values) / np.sum(np.isfinite(values)))
+
+    return surface
+
+
+@pytest.mark.parametrize('boundary', ['continuous', 'cut'])
+def test_SCF_noninteger_shift_reference(boundary):
+    rolls = np.array([-4.5, -3.0, -1.5, 0, 1.5, 3.0, 4.5]) * u.pix
+    tester = SCF(dataset1["cube"], roll_lags=rolls)
+    tester.compute_surface(boundary=boundary, show_progress=False)
+
+    surface = _scf_surface_reference(tester.data, rolls.value, boundary)
+
+    npt.assert_allclose(tester.scf_surface, surface)
+
+
 def test_SCF_nonpixelunit_shift():
     # Not testing against anything, just make sure it runs w/o issue.
     rolls = np.array([-4.5, -3.0, -1.5, 0, 1.5, 3.0, 4.5]) * u.pix
@@ -164,6 +269,16 @@ def test_SCF_distance():
                             computed_distances['scf_distance'])
 
 
+def test_SCF_distance_parallel():
+    tester_dist = \
+        SCF_Distance(dataset1["cube"],
+                     dataset2["cube"], size=11, parallel=True)
+    tester_dist.distance_metric()
+
+    npt.assert_almost_equal(tester_dist.distance,
+                            computed_distances['scf_distance'])
+
+
 def test_SCF_regrid_distance():
     hdr = dataset1["cube"][1].copy()
     hdr["CDELT2"] = 0.5 * hdr["CDELT2"]
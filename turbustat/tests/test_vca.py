@@ -131,6 +131,29 @@ def test_VCA_distance():
                             computed_distances['vca_distance'])
 
 
+def test_VCA_distance_parallel():
+    tester_dist = \
+        VCA_Distance(dataset1["cube"],
+                     dataset2["cube"], parallel=True)
+    tester_dist.distance_metric()
+
+    npt.assert_almost_equal(tester_dist.distance,
+                            computed_distances['vca_distance'])
+
+
+@pytest.mark.parametrize('parallel', [False, True])
+def test_VCA_distance_pspec_kwargs2(parallel):
+    tester_dist = \
+        VCA_Distance(dataset1["cube"],
+                     dataset2["cube"],
+                     radial_pspec_kwargs={'binsize': 1.},
+                     radial_pspec_kwargs2={'binsize': 2.},
+                     parallel=parallel)
+
+    # cube2 uses its own binning
+    assert tester_dist.vca2.freqs.size < tester_dist.vca1.freqs.size
+
+
 @pytest.mark.parametrize(("regrid_type", "channel_width"),
                          [['downsample', 2 * u.pix], ['downsample', 2],
                           ['downsample', 80.1 * u.m / u.s],